@@ -1,22 +1,55 @@
 # alunos.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 # Importa as funções e classes do FastAPI:
 # - APIRouter: Usado para criar um roteador que agrupa as rotas relacionadas.
 # - Depends: Usado para injetar dependências, como a sessão de banco de dados nas rotas.
 # - HTTPException: Usado para lançar exceções HTTP personalizadas, como erros 404 ou 400.
+# - Query: Usado para declarar e validar parâmetros de consulta (query string), como os da paginação.
+# - Request: Usado para ler os cabeçalhos da requisição, como o 'If-None-Match'.
+# - Response: Usado para definir cabeçalhos da resposta (como o 'ETag') e para responder sem corpo (304 Not Modified).
 
-from sqlalchemy.orm import Session
-# Importa a classe 'Session' da SQLAlchemy, que representa uma sessão de banco de dados. 
-# Ela será usada para interagir com o banco dentro das rotas.
+from fastapi.responses import ORJSONResponse, StreamingResponse
+# Importa as classes de resposta do FastAPI:
+# - ORJSONResponse: Gera respostas JSON usando a biblioteca 'orjson' (mais rápida que o 'json' padrão do Python).
+# - StreamingResponse: Envia a resposta em partes, à medida que ela é gerada.
 
-from models import AlunoDB, Aluno
+import orjson
+# Importa a biblioteca 'orjson', usada para converter os alunos em JSON (mais rápida que o 'json' padrão do Python).
+
+import xxhash
+# Importa a biblioteca 'xxhash', usada para calcular o 'ETag' (uma impressão digital) das respostas.
+# O xxHash é muito mais rápido que o MD5; ele não serve para criptografia, mas basta para diferenciar versões de uma mesma resposta.
+
+import asyncio
+# Importa o módulo 'asyncio', usado para executar várias consultas assíncronas ao mesmo tempo.
+
+from sqlalchemy import select, insert, update, delete
+# Importa as funções 'select', 'insert', 'update' e 'delete' da SQLAlchemy, usadas para montar as consultas (SELECT),
+# inserções (INSERT), atualizações (UPDATE) e exclusões (DELETE) que serão executadas de forma assíncrona.
+
+from sqlalchemy.ext.asyncio import AsyncSession
+# Importa a classe 'AsyncSession' da SQLAlchemy, que representa uma sessão assíncrona de banco de dados.
+# Ela será usada para interagir com o banco dentro das rotas sem bloquear o event loop.
+
+from models import AlunoDB, AlunoCreate, AlunoRead, AlunoPagina
 # Importa os modelos definidos no arquivo 'models.py':
 # - AlunoDB: O modelo SQLAlchemy que representa a tabela de alunos no banco de dados.
-# - Aluno: O modelo Pydantic que é usado para validar os dados de entrada e saída da API.
+# - AlunoCreate: O modelo Pydantic que é usado para validar os dados de entrada da API.
+# - AlunoRead: O modelo Pydantic que é usado para formatar os dados de saída da API (incluindo o 'id').
+# - AlunoPagina: O modelo Pydantic que representa uma página da listagem de alunos.
 
-from database import get_db
-# Importa a função 'get_db' do arquivo 'database.py', que é usada para criar uma sessão de banco de dados.
+from database import get_db, SessionLocal, DB_POOL_SIZE
+# Importa do arquivo 'database.py':
+# - get_db: A função que é usada para criar uma sessão de banco de dados nas rotas.
+# - SessionLocal: A fábrica de sessões, usada pelas consultas em cache e pela exportação, que não dependem da sessão da rota.
+# - DB_POOL_SIZE: A quantidade de conexões mantidas no pool, usada para limitar as consultas simultâneas da busca de vários alunos.
+
+from async_lru import alru_cache
+# Importa o decorador 'alru_cache', que guarda em memória o resultado de funções assíncronas por um tempo limitado.
+
+from cachetools import TTLCache
+# Importa o 'TTLCache', um dicionário cujos itens expiram automaticamente após um tempo definido.
 
 from sqlalchemy.exc import IntegrityError
 # Importa a exceção 'IntegrityError' do SQLAlchemy, que será usada para capturar erros de integridade, como a tentativa de inserir um RA duplicado.
@@ -26,26 +59,95 @@ router = APIRouter()
 # Instancia um APIRouter, que agrupa e gerencia as rotas da API relacionadas ao contexto de alunos.
 # Esse roteador será incluído no app principal em 'main.py'.
 
-@router.post("/alunos/", response_model=Aluno)
-# Define a rota POST "/alunos/" para criar um novo aluno. O parâmetro 'response_model=Aluno' indica que a resposta da rota será validada e formatada conforme o modelo Pydantic 'Aluno'.
-async def criar_aluno(aluno: Aluno, db: Session = Depends(get_db)):
+MAX_RAS_BUSCA = 50
+# Quantidade máxima de RAs aceitos pela rota de busca de vários alunos.
+
+_limite_buscas = asyncio.Semaphore(max(1, DB_POOL_SIZE // 2))
+# Limita quantas buscas por RA (de todas as requisições à rota de busca) podem ocupar uma conexão ao mesmo tempo.
+# Cada RA fora do cache abre a sua própria sessão; sem esse limite, poucas buscas simultâneas esgotariam o pool.
+# Com metade do pool, as demais rotas continuam tendo conexões disponíveis.
+
+# Cache da listagem de alunos
+_cache_lista = TTLCache(maxsize=128, ttl=5)
+# Guarda as páginas da listagem de alunos consultadas recentemente por 5 segundos, evitando repetir a consulta a cada requisição.
+
+def _lista_json(alunos):
+    # Converte uma lista de objetos 'AlunoDB' em uma resposta JSON no formato do modelo 'AlunoRead'.
+    # Os dados já foram validados quando os alunos foram gravados, então cada aluno vira um dicionário simples
+    # que o 'orjson' transforma em JSON diretamente, sem passar novamente pelo Pydantic (como já faz 'listar_alunos').
+
+    return ORJSONResponse([{"id": aluno.id, "nome": aluno.nome, "email": aluno.email, "ra": aluno.ra} for aluno in alunos])
+
+def _etag(dados: bytes):
+    # Calcula o 'ETag' de uma resposta: um identificador que muda sempre que os dados mudam.
+    # O cliente pode enviá-lo de volta no cabeçalho 'If-None-Match' para saber se a sua cópia ainda é válida.
+
+    return '"' + xxhash.xxh3_64_hexdigest(dados) + '"'
+    # Retorna o hash dos dados entre aspas, como exige o formato do cabeçalho 'ETag'.
+
+def _etag_confere(request: Request, etag: str):
+    # Verifica se o cliente já possui a versão atual da resposta, comparando o 'ETag' com o cabeçalho 'If-None-Match'.
+
+    etags_cliente = [valor.strip().removeprefix("W/") for valor in request.headers.get("if-none-match", "").split(",")]
+    # O cabeçalho pode conter vários 'ETags' separados por vírgula, inclusive na forma fraca (W/"...").
+
+    return etag in etags_cliente or "*" in etags_cliente
+
+@alru_cache(maxsize=1024, ttl=30)
+async def _aluno_por_ra(ra: str):
+    # Função assíncrona que busca um aluno pelo RA, com o resultado guardado em cache por 30 segundos.
+    # Ela abre a sua própria sessão com 'SessionLocal', para que apenas o RA faça parte da chave do cache.
+
+    async with SessionLocal() as db:
+        result = await db.execute(select(AlunoDB).where(AlunoDB.ra == ra))
+        return result.scalar_one_or_none()
+        # Retorna o aluno encontrado (ou None).
+
+def _invalidar_cache(*ras: str):
+    # Remove dos caches os dados que deixaram de ser válidos após criar, atualizar ou deletar alunos.
+
+    for ra in ras:
+        _aluno_por_ra.cache_invalidate(ra)
+        # Remove o aluno com esse RA do cache de consultas por RA.
+
+    _cache_lista.clear()
+    # Descarta as páginas da listagem guardadas, que precisarão ser consultadas novamente.
+
+@router.post("/alunos/", response_model=AlunoRead)
+# Define a rota POST "/alunos/" para criar um novo aluno. O parâmetro 'response_model=AlunoRead' indica que a resposta da rota será validada e formatada conforme o modelo Pydantic 'AlunoRead'.
+async def criar_aluno(aluno: AlunoCreate, db: AsyncSession = Depends(get_db)):
     # Função assíncrona que cria um novo aluno no banco de dados.
     # Recebe:
-    # - 'aluno': Um objeto do tipo 'Aluno' validado via Pydantic.
+    # - 'aluno': Um objeto do tipo 'AlunoCreate' validado via Pydantic.
     # - 'db': Uma sessão de banco de dados, obtida através de dependência injetada com 'get_db()'.
     
-    aluno_db = AlunoDB(nome=aluno.nome, email=aluno.email, ra=aluno.ra)
-    # Cria uma nova instância do modelo SQLAlchemy 'AlunoDB' com os dados do aluno passado via 'aluno'.
-
     try:
-        db.add(aluno_db)
-        # Adiciona o novo aluno à sessão de banco de dados, mas ainda não o grava no banco de dados.
+        if db.bind.dialect.insert_returning:
+            # Bancos com suporte a 'RETURNING' devolvem o aluno inserido (já com o 'id' gerado) no próprio INSERT,
+            # sem precisar de um SELECT extra para recarregar o objeto.
+
+            result = await db.execute(insert(AlunoDB).values(**aluno.model_dump()).returning(AlunoDB))
+            aluno_db = result.scalar_one()
+            # Executa o INSERT e obtém o objeto 'AlunoDB' gravado.
+
+        else:
+            # O MySQL não possui 'RETURNING': o aluno é adicionado à sessão e enviado ao banco com 'flush()',
+            # que já preenche o 'id' gerado automaticamente sem uma consulta adicional.
+
+            aluno_db = AlunoDB(nome=aluno.nome, email=aluno.email, ra=aluno.ra)
+            # Cria uma nova instância do modelo SQLAlchemy 'AlunoDB' com os dados do aluno passado via 'aluno'.
+
+            db.add(aluno_db)
+            # Adiciona o novo aluno à sessão de banco de dados, mas ainda não o grava no banco de dados.
+
+            await db.flush()
+            # Envia o INSERT ao banco, preenchendo o 'id' do objeto 'aluno_db'.
 
-        db.commit()
+        await db.commit()
         # Confirma as mudanças e grava o novo aluno no banco de dados.
 
-        db.refresh(aluno_db)
-        # Atualiza o objeto 'aluno_db' com os dados mais recentes do banco, como o 'id' gerado automaticamente.
+        _invalidar_cache(aluno.ra)
+        # Remove dos caches os dados desatualizados (como uma busca anterior por esse RA que não encontrou o aluno).
 
         return aluno_db
         # Retorna o objeto 'aluno_db', agora gravado no banco de dados, como resposta da API.
@@ -53,35 +155,206 @@ async def criar_aluno(aluno: Aluno, db: Session = Depends(get_db)):
     except IntegrityError:
         # Captura erros de integridade, como a tentativa de inserir um RA duplicado.
 
-        db.rollback()
+        await db.rollback()
         # Desfaz qualquer transação pendente para evitar a corrupção dos dados no banco.
 
         raise HTTPException(status_code=400, detail="Aluno com esse RA já existe.")
         # Lança uma exceção HTTP 400 informando que o RA do aluno já existe.
 
-@router.get("/alunos/", response_model=list[Aluno])
-# Define a rota GET "/alunos/" para listar todos os alunos.
-# O parâmetro 'response_model=list[Aluno]' indica que a resposta será uma lista de objetos validados pelo modelo 'Aluno'.
-async def listar_alunos(db: Session = Depends(get_db)):
-    # Função assíncrona que lista todos os alunos do banco de dados.
-    # Recebe uma sessão de banco de dados como dependência injetada.
+@router.post("/alunos/bulk", response_model=list[AlunoRead])
+# Define a rota POST "/alunos/bulk" para criar vários alunos de uma só vez.
+# O parâmetro 'response_model=list[AlunoRead]' indica que a resposta será uma lista de objetos validados pelo modelo 'AlunoRead'.
+async def criar_alunos_em_lote(alunos: list[AlunoCreate], db: AsyncSession = Depends(get_db)):
+    # Função assíncrona que cria vários alunos no banco de dados com um único INSERT de múltiplas linhas.
+    # Recebe:
+    # - 'alunos': Uma lista de objetos do tipo 'AlunoCreate' validados via Pydantic.
+    # - 'db': Uma sessão de banco de dados, obtida através de dependência injetada com 'get_db()'.
+    # Diferente de chamar 'criar_aluno' várias vezes, aqui todos os alunos são gravados com uma única ida ao banco e um único commit.
+
+    if not alunos:
+        return []
+        # Se a lista estiver vazia, não há nada a inserir.
+
+    valores = [aluno.model_dump() for aluno in alunos]
+    # Converte cada aluno recebido em um dicionário com os valores das colunas.
+
+    try:
+        if db.bind.dialect.insert_executemany_returning:
+            # Bancos com suporte a 'RETURNING' (como PostgreSQL e MariaDB) devolvem as linhas inseridas no próprio INSERT.
+
+            result = await db.execute(insert(AlunoDB).returning(AlunoDB, sort_by_parameter_order=True), valores)
+            alunos_db = result.scalars().all()
+            # Executa um único INSERT com todas as linhas e obtém os alunos gravados, já com o 'id' gerado.
+            # 'sort_by_parameter_order=True' garante que os alunos voltem na mesma ordem em que foram enviados,
+            # mesmo quando o lote é dividido em vários INSERTs.
+
+        else:
+            # O MySQL não possui 'RETURNING': o INSERT de múltiplas linhas é feito sem retorno
+            # e os alunos gravados são buscados depois com uma única consulta pelos RAs.
+
+            await db.execute(insert(AlunoDB), valores)
+            # Executa um único INSERT com todas as linhas.
 
-    return db.query(AlunoDB).all()
-    # Realiza uma consulta no banco de dados buscando todos os registros da tabela 'AlunoDB'.
-    # Retorna a lista de alunos.
+            result = await db.execute(
+                select(AlunoDB).where(AlunoDB.ra.in_([aluno.ra for aluno in alunos])).order_by(AlunoDB.id)
+            )
+            alunos_db = result.scalars().all()
+            # Busca os alunos recém-inseridos pelos seus RAs, ordenados pelo 'id'.
+            # Como os 'ids' de um mesmo INSERT de múltiplas linhas são gerados na ordem das linhas,
+            # os alunos voltam na mesma ordem em que foram enviados.
 
-@router.get("/alunos/{ra}", response_model=Aluno)
+        await db.commit()
+        # Confirma as mudanças e grava todos os alunos no banco de dados com um único commit.
+
+        _invalidar_cache(*(aluno.ra for aluno in alunos))
+        # Remove dos caches os dados desatualizados.
+
+        return _lista_json(alunos_db)
+        # Retorna a lista de alunos gravados no banco de dados como resposta da API.
+
+    except IntegrityError:
+        # Captura erros de integridade, como a tentativa de inserir um RA duplicado (no banco ou dentro do próprio lote).
+
+        await db.rollback()
+        # Desfaz a transação inteira, de modo que nenhum aluno do lote é gravado.
+
+        raise HTTPException(status_code=400, detail="Aluno com esse RA já existe.")
+        # Lança uma exceção HTTP 400 informando que o RA de algum aluno já existe.
+
+@router.get("/alunos/", response_model=AlunoPagina)
+# Define a rota GET "/alunos/" para listar os alunos, uma página por vez.
+# O parâmetro 'response_model=AlunoPagina' indica que a resposta será uma página com a lista de alunos e o cursor da próxima página.
+async def listar_alunos(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+    after_id: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    # Função assíncrona que lista os alunos do banco de dados usando paginação por cursor.
+    # Recebe:
+    # - 'request': A requisição, usada para ler o cabeçalho 'If-None-Match'.
+    # - 'limit': A quantidade máxima de alunos por página (entre 1 e 500, padrão 50).
+    # - 'after_id': O cursor da página, ou seja, lista apenas alunos com 'id' maior que esse valor (0 para a primeira página).
+    # - 'db': A sessão de banco de dados, injetada como dependência.
+    # Diferente do OFFSET, o filtro 'id > after_id' usa o índice da chave primária, então o custo de cada página não cresce com o tamanho da tabela.
+
+    pagina = _cache_lista.get((limit, after_id))
+    # Tenta obter a página guardada em cache (o JSON da página e o seu 'ETag').
+
+    if pagina is None:
+        # Se a página não estiver em cache (ou tiver expirado), consulta o banco de dados.
+
+        result = await db.execute(
+            select(AlunoDB.id, AlunoDB.nome, AlunoDB.email, AlunoDB.ra)
+            .where(AlunoDB.id > after_id)
+            .order_by(AlunoDB.id)
+            .limit(limit)
+        )
+        # Realiza uma consulta no banco de dados buscando os próximos 'limit' alunos após o cursor, ordenados pelo 'id'.
+        # Apenas as colunas devolvidas pela API são selecionadas, e o resultado vem em linhas simples,
+        # sem criar objetos 'AlunoDB' completos (que seriam mais lentos de montar e ocupariam mais memória).
+
+        alunos = [dict(aluno) for aluno in result.mappings()]
+        # 'mappings()' devolve cada linha como um mapeamento 'coluna -> valor', que é convertido em dicionário,
+        # já no formato do modelo 'AlunoRead' e pronto para ser transformado em JSON.
+
+        conteudo = orjson.dumps({"data": alunos, "next": alunos[-1]["id"] if len(alunos) == limit else None})
+        # Monta o JSON da página com os alunos e o cursor da próxima página.
+        # Se a página veio incompleta, não há mais alunos a listar e o cursor é None.
+
+        pagina = (conteudo, _etag(conteudo))
+        # O 'ETag' é calculado sobre o próprio JSON da página, então qualquer aluno criado, alterado ou deletado na página o modifica.
+
+        _cache_lista[(limit, after_id)] = pagina
+        # Guarda a página já convertida (e o seu 'ETag') em cache para as próximas requisições.
+
+    conteudo, etag = pagina
+
+    if _etag_confere(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+        # Se o cliente já possui essa versão da página, responde 304 (Not Modified), sem enviar o corpo.
+
+    return Response(content=conteudo, media_type="application/json", headers={"ETag": etag})
+    # Retorna a página diretamente como JSON, sem que o FastAPI precise validá-la e convertê-la novamente.
+
+@router.get("/alunos/exportar", response_model=list[AlunoRead])
+# Define a rota GET "/alunos/exportar" para obter todos os alunos de uma só vez.
+# Ela precisa ser declarada antes de "/alunos/{ra}", caso contrário "exportar" seria interpretado como um RA.
+# O parâmetro 'response_model=list[AlunoRead]' documenta que a resposta é uma lista de alunos no formato do modelo 'AlunoRead'.
+async def exportar_alunos():
+    # Função assíncrona que envia todos os alunos do banco de dados em partes, sem montar a lista inteira em memória.
+
+    async def gerar():
+        # Gerador assíncrono que produz o JSON da lista de alunos aos poucos.
+        # Ele abre a sua própria sessão com 'SessionLocal', pois a sessão de 'get_db' é fechada antes de a resposta ser enviada.
+
+        async with SessionLocal() as db:
+            result = await db.stream(
+                select(AlunoDB.id, AlunoDB.nome, AlunoDB.email, AlunoDB.ra)
+                .order_by(AlunoDB.id)
+                .execution_options(yield_per=1000)
+            )
+            # Realiza uma consulta no banco de dados buscando todos os alunos, ordenados pelo 'id'.
+            # 'stream' com 'yield_per=1000' busca as linhas do banco em blocos de 1000, em vez de carregar a tabela inteira.
+
+            yield b"["
+            primeiro = True
+
+            async for aluno in result.mappings():
+                if not primeiro:
+                    yield b","
+                primeiro = False
+
+                yield orjson.dumps(dict(aluno))
+                # Converte cada aluno em JSON e o envia assim que é lido do banco.
+
+            yield b"]"
+
+    return StreamingResponse(gerar(), media_type="application/json")
+    # Retorna a resposta em partes: o cliente começa a receber os alunos antes de a consulta terminar.
+
+@router.get("/alunos/busca", response_model=list[AlunoRead])
+# Define a rota GET "/alunos/busca" para obter vários alunos a partir de uma lista de RAs (por exemplo, "/alunos/busca?ra=1&ra=2").
+# Ela precisa ser declarada antes de "/alunos/{ra}", caso contrário "busca" seria interpretado como um RA.
+# O parâmetro 'response_model=list[AlunoRead]' indica que a resposta será uma lista de objetos validados pelo modelo 'AlunoRead'.
+async def buscar_alunos(ra: list[str] = Query(default=[])):
+    # Função assíncrona que obtém vários alunos pelos seus RAs.
+    # Recebe:
+    # - 'ra': A lista de RAs, passada repetindo o parâmetro 'ra' na URL (sem nenhum RA, a resposta é uma lista vazia).
+
+    ras = list(dict.fromkeys(ra))
+    # Remove RAs repetidos, mantendo a ordem em que foram informados.
+
+    if len(ras) > MAX_RAS_BUSCA:
+        # Limita a quantidade de RAs por busca, para que uma única requisição não monopolize as consultas ao banco.
+
+        raise HTTPException(status_code=400, detail=f"Informe no máximo {MAX_RAS_BUSCA} RAs por busca.")
+        # Lança uma exceção HTTP 400 informando o limite de RAs.
+
+    async def buscar(r: str):
+        async with _limite_buscas:
+            return await _aluno_por_ra(r)
+        # Aguarda uma vaga em '_limite_buscas' antes de buscar o aluno, para não ultrapassar o limite de conexões simultâneas.
+
+    alunos = await asyncio.gather(*(buscar(r) for r in ras))
+    # Busca os alunos ao mesmo tempo (até o limite de '_limite_buscas'), em vez de um após o outro.
+    # Cada busca usa o cache de '_aluno_por_ra' e, quando necessário, a sua própria sessão (e conexão) com o banco de dados.
+
+    return _lista_json([aluno for aluno in alunos if aluno is not None])
+    # Retorna apenas os alunos encontrados.
+
+@router.get("/alunos/{ra}", response_model=AlunoRead)
 # Define a rota GET "/alunos/{ra}" para obter um aluno específico baseado no RA.
-# O parâmetro 'response_model=Aluno' valida a resposta da API para que esteja de acordo com o modelo 'Aluno'.
-async def obter_aluno(ra: str, db: Session = Depends(get_db)):
+# O parâmetro 'response_model=AlunoRead' valida a resposta da API para que esteja de acordo com o modelo 'AlunoRead'.
+async def obter_aluno(ra: str, request: Request, response: Response):
     # Função assíncrona que obtém um aluno específico pelo RA.
     # Recebe:
     # - 'ra': O RA do aluno passado como parâmetro na URL.
-    # - 'db': A sessão de banco de dados, injetada como dependência.
+    # - 'request': A requisição, usada para ler o cabeçalho 'If-None-Match'.
+    # - 'response': A resposta, usada para enviar o cabeçalho 'ETag'.
 
-    aluno = db.query(AlunoDB).filter(AlunoDB.ra == ra).first()
-    # Realiza uma consulta no banco de dados buscando o aluno com o RA fornecido.
-    # 'filter' aplica o filtro pelo RA, e 'first()' retorna o primeiro registro correspondente.
+    aluno = await _aluno_por_ra(ra)
+    # Busca o aluno com o RA fornecido, usando o cache quando o mesmo RA foi consultado recentemente.
 
     if aluno is None:
         # Verifica se o aluno foi encontrado.
@@ -89,20 +362,64 @@ async def obter_aluno(ra: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Aluno não encontrado.")
         # Se o aluno não for encontrado, lança uma exceção HTTP 404 com a mensagem "Aluno não encontrado".
 
+    etag = _etag(f"{aluno.id}-{aluno.updated_at}-{aluno.nome}-{aluno.email}-{aluno.ra}".encode())
+    # Calcula o 'ETag' a partir do 'id' e da data da última alteração do aluno.
+    # Os demais campos também entram no cálculo, pois a data é gravada com precisão de segundos
+    # e duas alterações no mesmo segundo teriam a mesma data.
+
+    if _etag_confere(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+        # Se o cliente já possui essa versão do aluno, responde 304 (Not Modified), sem enviar o corpo.
+
+    response.headers["ETag"] = etag
+    # Envia o 'ETag' junto com o aluno, para que o cliente possa usá-lo nas próximas requisições.
+
     return aluno
     # Retorna o aluno encontrado.
 
-@router.put("/alunos/{ra}", response_model=Aluno)
+@router.put("/alunos/{ra}", response_model=AlunoRead)
 # Define a rota PUT "/alunos/{ra}" para atualizar um aluno específico com base no RA.
-# O parâmetro 'response_model=Aluno' valida e formata a resposta da API conforme o modelo 'Aluno'.
-async def atualizar_aluno(ra: str, aluno_atualizado: Aluno, db: Session = Depends(get_db)):
+# O parâmetro 'response_model=AlunoRead' valida e formata a resposta da API conforme o modelo 'AlunoRead'.
+async def atualizar_aluno(ra: str, aluno_atualizado: AlunoCreate, db: AsyncSession = Depends(get_db)):
     # Função assíncrona que atualiza os dados de um aluno.
     # Recebe:
     # - 'ra': O RA do aluno a ser atualizado, passado como parâmetro na URL.
     # - 'aluno_atualizado': O objeto Pydantic contendo os novos dados do aluno.
     # - 'db': A sessão de banco de dados, injetada como dependência.
 
-    aluno = db.query(AlunoDB).filter(AlunoDB.ra == ra).first()
+    if db.bind.dialect.update_returning:
+        # Bancos com suporte a 'RETURNING' atualizam e devolvem o aluno com um único comando UPDATE,
+        # sem precisar buscá-lo antes nem recarregá-lo depois.
+
+        result = await db.execute(
+            update(AlunoDB)
+            .where(AlunoDB.ra == ra)
+            .values(nome=aluno_atualizado.nome, email=aluno_atualizado.email)
+            .returning(AlunoDB)
+            .execution_options(synchronize_session=False)
+        )
+        aluno = result.scalar_one_or_none()
+        # Atualiza os campos 'nome' e 'email' do aluno com o RA fornecido e obtém o aluno atualizado (ou None).
+
+        if aluno is None:
+            # Verifica se algum aluno foi atualizado.
+
+            raise HTTPException(status_code=404, detail="Aluno não encontrado.")
+            # Se o aluno não for encontrado, lança uma exceção HTTP 404.
+
+        await db.commit()
+        # Confirma as mudanças no banco de dados.
+
+        _invalidar_cache(ra)
+        # Remove dos caches os dados desatualizados do aluno.
+
+        return aluno
+        # Retorna o aluno atualizado como resposta.
+
+    # O MySQL não possui 'RETURNING': o aluno é buscado, alterado e gravado pela sessão.
+
+    result = await db.execute(select(AlunoDB).where(AlunoDB.ra == ra))
+    aluno = result.scalar_one_or_none()
     # Busca o aluno no banco de dados pelo RA.
 
     if aluno is None:
@@ -115,26 +432,48 @@ async def atualizar_aluno(ra: str, aluno_atualizado: Aluno, db: Session = Depend
     aluno.email = aluno_atualizado.email
     # Atualiza os campos 'nome' e 'email' do aluno com os novos dados recebidos.
 
-    db.commit()
+    await db.commit()
     # Confirma as mudanças no banco de dados.
 
-    db.refresh(aluno)
-    # Atualiza o objeto 'aluno' com os dados mais recentes do banco.
+    _invalidar_cache(ra)
+    # Remove dos caches os dados desatualizados do aluno.
 
     return aluno
     # Retorna o aluno atualizado como resposta.
+    # Como as sessões são criadas com 'expire_on_commit=False', os atributos do aluno continuam válidos após o commit,
+    # sem a necessidade de recarregá-lo do banco com 'refresh()'.
 
-@router.delete("/alunos/{ra}", response_model=Aluno)
+@router.delete("/alunos/{ra}", response_model=AlunoRead)
 # Define a rota DELETE "/alunos/{ra}" para deletar um aluno específico com base no RA.
-# O parâmetro 'response_model=Aluno' valida e formata a resposta da API conforme o modelo 'Aluno'.
-async def deletar_aluno(ra: str, db: Session = Depends(get_db)):
+# O parâmetro 'response_model=AlunoRead' valida e formata a resposta da API conforme o modelo 'AlunoRead'.
+async def deletar_aluno(ra: str, db: AsyncSession = Depends(get_db)):
     # Função assíncrona que deleta um aluno específico pelo RA.
     # Recebe:
     # - 'ra': O RA do aluno a ser deletado.
     # - 'db': A sessão de banco de dados, injetada como dependência.
 
-    aluno = db.query(AlunoDB).filter(AlunoDB.ra == ra).first()
-    # Busca o aluno no banco de dados pelo RA.
+    if db.bind.dialect.delete_returning:
+        # Bancos com suporte a 'RETURNING' deletam e devolvem o aluno com um único comando DELETE.
+
+        result = await db.execute(
+            delete(AlunoDB)
+            .where(AlunoDB.ra == ra)
+            .returning(AlunoDB)
+            .execution_options(synchronize_session=False)
+        )
+        aluno = result.scalar_one_or_none()
+        # Deleta o aluno com o RA fornecido e obtém os dados do aluno deletado (ou None).
+
+    else:
+        # O MySQL não possui 'RETURNING': o aluno é buscado e depois deletado pela sessão.
+
+        result = await db.execute(select(AlunoDB).where(AlunoDB.ra == ra))
+        aluno = result.scalar_one_or_none()
+        # Busca o aluno no banco de dados pelo RA.
+
+        if aluno is not None:
+            await db.delete(aluno)
+            # Deleta o aluno encontrado no banco de dados.
 
     if aluno is None:
         # Verifica se o aluno foi encontrado.
@@ -142,11 +481,11 @@ async def deletar_aluno(ra: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Aluno não encontrado.")
         # Se o aluno não for encontrado, lança uma exceção HTTP 404.
 
-    db.delete(aluno)
-    # Deleta o aluno encontrado no banco de dados.
-
-    db.commit()
+    await db.commit()
     # Confirma a exclusão do aluno no banco de dados.
 
+    _invalidar_cache(ra)
+    # Remove dos caches o aluno deletado.
+
     return aluno
     # Retorna o aluno deletado como resposta (antes de sua exclusão).
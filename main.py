@@ -1,37 +1,49 @@
 # main.py
 
+import os
+
 from fastapi import FastAPI
 # Importa a classe 'FastAPI', que é usada para criar a aplicação web FastAPI.
 
+from fastapi.responses import ORJSONResponse
+# Importa a classe 'ORJSONResponse', que gera respostas JSON usando a biblioteca 'orjson', bem mais rápida que o 'json' padrão do Python.
+
 from models import AlunoDB
 # Importa o modelo 'AlunoDB' definido no arquivo 'models.py'. Esse modelo representa a tabela de alunos no banco de dados.
 
-from database import engine
-# Importa o 'engine', que é o objeto de conexão com o banco de dados, criado em 'database.py'.
+from database import engine, Base
+# Importa o 'engine', que é o objeto de conexão assíncrona com o banco de dados, criado em 'database.py'.
 # O 'engine' é responsável por gerenciar as interações com o banco de dados MySQL.
+# Importa também a 'Base', cujos metadados descrevem todas as tabelas dos modelos (como a de 'AlunoDB').
 
 from alunos import router as alunos_router  # Importa o roteador de alunos
 # Importa o roteador de rotas do arquivo 'alunos.py', renomeando-o para 'alunos_router'. 
 # Esse roteador contém todas as rotas relacionadas ao CRUD de alunos, como criar, listar, buscar, atualizar e deletar.
 
-# Criar as tabelas no banco de dados
-AlunoDB.metadata.create_all(bind=engine)
-# Gera as tabelas no banco de dados com base nos modelos definidos, neste caso, o 'AlunoDB'.
-# 'metadata.create_all(bind=engine)' garante que, se as tabelas ainda não existirem no banco de dados, elas serão criadas.
-# O 'engine' está associado ao banco de dados, garantindo que as tabelas sejam criadas no banco configurado.
-
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 # Cria uma instância da aplicação FastAPI, que é usada para definir as rotas, middlewares e configurações gerais da API.
+# 'default_response_class=ORJSONResponse' faz com que todas as rotas respondam usando 'orjson' para gerar o JSON.
+
+# Configuração da compressão das respostas
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+# Comprime com gzip as respostas para os clientes que aceitam esse formato (como as listagens de alunos em JSON).
+# 'minimum_size=1000' evita comprimir respostas pequenas (menos de 1000 bytes), como mensagens de erro,
+# e 'compresslevel=5' equilibra o tamanho da resposta e o uso de CPU.
 
 # Configuração do CORS
+origens = [origem.strip() for origem in os.getenv("CORS_ORIGINS", "").split(",") if origem.strip()]
+# Lê as origens permitidas (os endereços do frontend) da variável de ambiente 'CORS_ORIGINS', separadas por vírgula.
+# Exemplo: CORS_ORIGINS=http://localhost:3000,https://meusite.com.br
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Permite todas as origens (pode ser restrito a domínios específicos)
-    allow_credentials=True,
-    allow_methods=["*"],  # Permite todos os métodos HTTP (GET, POST, PUT, DELETE)
-    allow_headers=["*"],  # Permite todos os cabeçalhos
+    allow_origins=origens or ["*"],  # Permite apenas as origens configuradas (ou todas, se 'CORS_ORIGINS' não for definida)
+    allow_credentials=bool(origens),  # Credenciais (cookies, autenticação) só são permitidas com origens específicas, como exige a especificação do CORS
+    allow_methods=["GET", "POST", "PUT", "DELETE"],  # Permite apenas os métodos HTTP usados pela API
+    allow_headers=["Authorization", "Content-Type"],  # Permite apenas os cabeçalhos usados pela API
 )
 
 # Incluir as rotas do arquivo alunos.py
@@ -39,11 +51,57 @@ app.include_router(alunos_router)
 # Adiciona as rotas definidas em 'alunos.py' ao aplicativo FastAPI principal. 
 # Todas as rotas dentro de 'alunos_router' (como /alunos/) serão agora acessíveis através da aplicação FastAPI.
 
+async def criar_tabelas():
+    # Função assíncrona que verifica e garante que todas as tabelas relacionadas ao modelo 'AlunoDB' estejam criadas no banco de dados.
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Como o engine é assíncrono, o 'create_all' (que é síncrono) é executado através de 'conn.run_sync'.
+
 @app.on_event("startup")
 # Define um evento de inicialização ('startup') que é executado quando o servidor FastAPI é iniciado.
 # Funções decoradas com '@app.on_event("startup")' são executadas automaticamente antes de a API começar a aceitar requisições.
 
 async def startup():
-    AlunoDB.metadata.create_all(bind=engine)
-    # Durante o evento de inicialização, este comando verifica e garante que todas as tabelas relacionadas ao modelo 'AlunoDB' estejam criadas no banco de dados.
+    if os.getenv("CREATE_TABLES") != "1":
+        return
+        # As tabelas só são criadas quando a variável de ambiente 'CREATE_TABLES=1' é definida (por exemplo, em desenvolvimento).
+        # Em produção, onde as tabelas já são gerenciadas por migrações (por exemplo, com Alembic), a verificação é pulada.
+
+    await criar_tabelas()
+    # Durante o evento de inicialização, garante que as tabelas estejam criadas no banco de dados.
+    # As tabelas são criadas apenas aqui, uma única vez por processo, e não na importação do módulo.
     # Isso é especialmente útil para garantir que o banco de dados esteja pronto para uso quando a API começar a aceitar requisições.
+    # Com vários processos, cada um executaria essa criação ao mesmo tempo e os que perdessem a disputa falhariam ao iniciar;
+    # por isso, 'python main.py' cria as tabelas antes de iniciar os processos (veja abaixo).
+
+if __name__ == "__main__":
+    # Permite iniciar o servidor diretamente com 'python main.py'.
+
+    import asyncio
+    import uvicorn
+    # Importa o asyncio, usado para criar as tabelas antes de iniciar o servidor,
+    # e o Uvicorn, o servidor ASGI que executa a aplicação FastAPI.
+
+    if os.getenv("CREATE_TABLES") == "1":
+        # Cria as tabelas uma única vez, neste processo principal, antes de iniciar os processos do servidor.
+
+        async def preparar_banco():
+            await criar_tabelas()
+            await engine.dispose()
+            # Fecha as conexões abertas por este processo, que não atende requisições.
+
+        asyncio.run(preparar_banco())
+
+        os.environ["CREATE_TABLES"] = "0"
+        # Os processos do servidor herdam essa variável e, assim, não tentam criar as tabelas novamente.
+
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="auto",  # Usa o 'uvloop' (event loop escrito em C) quando instalado, com o asyncio padrão como alternativa
+        http="auto",  # Usa o 'httptools' (leitor de HTTP escrito em C) quando instalado, com o 'h11' como alternativa
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),  # Um processo por núcleo da CPU
+        limit_concurrency=2048,  # Número máximo de conexões simultâneas por processo
+    )
@@ -1,11 +1,16 @@
 # models.py
 
-from sqlalchemy import Column, Integer, String  
-# Importa as classes necessárias da SQLAlchemy para definir colunas e tipos de dados nas tabelas
+from sqlalchemy import Column, Integer, String, DateTime, func  
+# Importa as classes necessárias da SQLAlchemy para definir colunas e tipos de dados nas tabelas, e 'func' para usar funções SQL como NOW()
 from database import Base  
 # Importa a classe Base, que é a classe base declarativa de SQLAlchemy para definir o modelo de banco de dados
-from pydantic import BaseModel, EmailStr  
-# Importa o BaseModel e EmailStr de Pydantic, que serão usados para validação de dados na API
+from typing import Optional  
+# Importa o Optional, usado para indicar campos que podem ser nulos (None)
+from pydantic import BaseModel, EmailStr, ConfigDict, field_validator  
+# Importa o BaseModel, EmailStr, ConfigDict e field_validator de Pydantic, que serão usados para validação de dados na API
+
+RAS_RESERVADOS = {"exportar", "busca"}  
+# RAs que não podem ser usados, pois coincidem com rotas fixas da API (como "/alunos/exportar" e "/alunos/busca") e o aluno não poderia ser consultado por "/alunos/{ra}"
 
 # Modelo de tabela no banco de dados
 class AlunoDB(Base):  # Define o modelo da tabela "alunos" que será mapeado para o banco de dados
@@ -14,14 +19,32 @@ class AlunoDB(Base):  # Define o modelo da tabela "alunos" que será mapeado par
     id = Column(Integer, primary_key=True, index=True)  # Cria a coluna 'id' como chave primária (primary_key=True) e com índice (index=True)
     nome = Column(String(100), nullable=False)  # Cria a coluna 'nome' do tipo String com até 100 caracteres e define que ela não pode ser nula (nullable=False)
     email = Column(String(100), nullable=False)  # Cria a coluna 'email' do tipo String com até 100 caracteres, também não pode ser nula
-    ra = Column(String(50), unique=True, nullable=False)  # Cria a coluna 'ra' (registro acadêmico), que deve ser única (unique=True) e não nula
+    ra = Column(String(50), unique=True, index=True, nullable=False)  # Cria a coluna 'ra' (registro acadêmico), que deve ser única (unique=True), não nula e com índice (index=True), já que as rotas buscam alunos pelo RA
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)  # Cria a coluna 'updated_at' com a data da última alteração do aluno, preenchida pelo banco na criação (server_default) e atualizada a cada alteração (onupdate)
 
 # Modelo Pydantic para criação de alunos
-class Aluno(BaseModel):  # Define o modelo Pydantic, que será utilizado para validação e serialização de dados
+class AlunoCreate(BaseModel):  # Define o modelo dos dados recebidos pela API (sem o 'id', que é gerado pelo banco de dados)
     nome: str  # O campo 'nome' deve ser uma string
     email: EmailStr  # O campo 'email' deve ser um e-mail válido, validado pelo tipo específico EmailStr do Pydantic
     ra: str  # O campo 'ra' deve ser uma string
 
-    class Config:  # Define uma configuração especial para o modelo
-        orm_mode = True  # 'orm_mode' habilita o Pydantic para trabalhar diretamente com objetos do SQLAlchemy, convertendo-os em dados Pydantic
+    @field_validator("ra")  # Define uma validação adicional para o campo 'ra'
+    @classmethod
+    def ra_nao_reservado(cls, ra: str):
+        if ra in RAS_RESERVADOS:  # Recusa RAs que coincidem com rotas fixas da API
+            raise ValueError(f"O RA '{ra}' é reservado e não pode ser usado.")
+        return ra
+
+# Modelo Pydantic para leitura de alunos
+class AlunoRead(BaseModel):  # Define o modelo dos dados devolvidos pela API
+    model_config = ConfigDict(from_attributes=True)  # 'from_attributes' habilita o Pydantic para trabalhar diretamente com objetos do SQLAlchemy, convertendo-os em dados Pydantic
+
+    id: int  # O campo 'id' é o identificador gerado pelo banco de dados
+    nome: str  # O campo 'nome' é uma string
+    email: str  # O campo 'email' é uma string simples: o e-mail já foi validado (com EmailStr) quando o aluno foi gravado, então não é validado de novo a cada resposta
+    ra: str  # O campo 'ra' é uma string
 
+# Modelo Pydantic para a listagem paginada de alunos
+class AlunoPagina(BaseModel):  # Define o modelo de uma página da listagem de alunos
+    data: list[AlunoRead]  # O campo 'data' contém os alunos da página
+    next: Optional[int]  # O campo 'next' é o cursor da próxima página (o 'id' do último aluno), ou None se não houver mais páginas